@@ -1,21 +1,120 @@
+import re
 import sqlite3
+import sys
 from datetime import date
+from itertools import chain
 
 data: str = 'bookstore.db'
 
+# 存於 PRAGMA user_version，標記預設資料已寫入（0 表示尚未處理）；
+# 未達此值的舊資料庫在連線時會補建資料表與索引，但此值並非資料表結構版本
+_SEEDED_VERSION: int = 1
+
+_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}').fullmatch
+
+# 銷售報表固定使用的分隔線與表頭
+_SEP50: str = "-" * 50
+_EQ50: str = "=" * 50
+_REPORT_HEADER: str = f"{'單價':<8}\t{'數量':<4}\t{'折扣':<6}\t{'小計'}"
+
+_MENU: str = (
+    "\n***************選單***************\n"
+    "1. 新增銷售記錄\n"
+    "2. 顯示銷售報表\n"
+    "3. 更新銷售記錄\n"
+    "4. 刪除銷售記錄\n"
+    "5. 離開\n"
+    "**********************************\n"
+)
+
+# 各功能使用的 SQL 語句集中定義於此
+# 一次查詢同時取得會員是否存在與書籍單價、庫存；書籍不存在時欄位為 NULL
+_SQL_VALIDATE_SALE: str = """
+    SELECT
+        (SELECT 1 FROM member WHERE mid = ?) AS m_ok,
+        b.bprice,
+        b.bstock
+    FROM (SELECT 1)
+    LEFT JOIN book b ON b.bid = ?
+"""
+_SQL_INSERT_SALE: str = """
+    INSERT INTO sale (sdate, mid, bid, sqty, sdiscount, stotal)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+_SQL_UPDATE_STOCK: str = "UPDATE book SET bstock = bstock - ? WHERE bid = ?"
+_SQL_REPORT: str = """
+    SELECT
+        s.sid,
+        s.sdate,
+        m.mname,
+        b.btitle,
+        b.bprice,
+        s.sqty,
+        s.sdiscount,
+        s.stotal
+    FROM sale s
+    JOIN member m ON s.mid = m.mid
+    JOIN book b ON s.bid = b.bid
+    ORDER BY s.sid
+"""
+_SQL_UPDATE_LIST: str = """
+    SELECT s.sid, m.mname, s.sdate, b.bprice, s.sqty
+    FROM sale s
+    JOIN member m ON s.mid = m.mid
+    JOIN book b ON s.bid = b.bid
+    ORDER BY s.sid
+"""
+_SQL_UPDATE_SALE: str = """
+    UPDATE sale SET sdiscount = ?, stotal = ? WHERE sid = ?
+"""
+_SQL_DELETE_LIST: str = """
+    SELECT s.sid, m.mname, s.sdate, b.btitle
+    FROM sale s
+    JOIN member m ON s.mid = m.mid
+    JOIN book b ON s.bid = b.bid
+    ORDER BY s.sid
+"""
+_SQL_DELETE_SALE: str = "DELETE FROM sale WHERE sid = ?"
+
 
 def checkdate(date_str: str) -> bool:
     """
-    驗證日期字串是否符合 YYYY-MM-DD 格式。
+    驗證日期字串是否符合 YYYY-MM-DD 格式，且為實際存在的日期。
 
     """
-    return len(date_str) == 10 and date_str.count('-') == 2
+    if _DATE_RE(date_str) is None:
+        return False
+    # 格式正確後再確認是實際存在的日期
+    try:
+        date.fromisoformat(date_str)
+    except ValueError:
+        return False
+    return True
 
 
 def connect_db() -> sqlite3.Connection:
     """建立並返回 SQLite 資料庫連線，設置 row_factory = sqlite3.Row"""
-    conn = sqlite3.connect(data)
+    conn = sqlite3.connect(data, cached_statements=256)
     conn.row_factory = sqlite3.Row
+    # 記憶體資料庫不支援 WAL 與 mmap，僅對檔案資料庫啟用
+    if data != ':memory:':
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        # 以記憶體映射讀取資料頁，256 MiB 僅為上限
+        conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-64000")
+    # schema_version 為 0 表示資料庫尚無任何資料表；user_version 未達
+    # _SEEDED_VERSION 則可能是舊版程式建立的資料庫，缺少後來新增的索引
+    if (conn.execute("PRAGMA schema_version").fetchone()[0] == 0
+            or conn.execute("PRAGMA user_version").fetchone()[0]
+            < _SEEDED_VERSION):
+        _ensure_schema(conn)
+    return conn
+
+
+def _ensure_schema(conn: sqlite3.Connection) -> None:
+    """建立資料表與索引（若尚不存在）"""
     conn.executescript('''
         CREATE TABLE IF NOT EXISTS member (
             mid TEXT PRIMARY KEY,
@@ -40,8 +139,10 @@ def connect_db() -> sqlite3.Connection:
             sdiscount INTEGER NOT NULL, -- 折扣金額，單位為元
             stotal INTEGER NOT NULL    -- 總額 = (書本單價 × 數量) - 折扣
         );
+
+        CREATE INDEX IF NOT EXISTS idx_sale_mid ON sale(mid);
+        CREATE INDEX IF NOT EXISTS idx_sale_bid ON sale(bid);
     ''')
-    return conn
 
 
 def initialize_db(conn: sqlite3.Connection) -> None:
@@ -52,34 +153,37 @@ def initialize_db(conn: sqlite3.Connection) -> None:
         ('M002', 'Bob', '0923-456789', 'bob@example.com'),
         ('M003', 'Cathy', '0934-567890', 'cathy@example.com')
     ]
-    cursor.executemany(
-        """
-        INSERT OR IGNORE INTO
-        member
-        VALUES (?, ?, ?, ?)
-        """,
-        member)
     book = [
         ('B001', 'Python Programming', 600, 50),
         ('B002', 'Data Science Basics', 800, 30),
         ('B003', 'Machine Learning Guide', 1200, 20)
     ]
-    cursor.executemany("INSERT OR IGNORE INTO book VALUES (?, ?, ?, ?)", book)
-    sdate = date.today().strftime('%Y-%m-%d')
+    sdate = date.today().isoformat()
     sale = [
         (sdate, 'M001', 'B001', 2, 100, 1100),
         (sdate, 'M002', 'B002', 1, 50, 750),
         (sdate, 'M001', 'B003', 3, 200, 3400),
         (sdate, 'M003', 'B001', 1, 0, 600)
     ]
-    cursor.executemany(
-        """
-        INSERT OR IGNORE INTO
-        sale (sdate, mid, bid, sqty, sdiscount, stotal)
-        VALUES (?, ?, ?, ?, ?, ?)
-        """,
-        sale
-    )
+    # 三張資料表的預設資料於同一筆交易中寫入並提交
+    with conn:
+        cursor.executemany(
+            """
+            INSERT OR IGNORE INTO
+            member
+            VALUES (?, ?, ?, ?)
+            """,
+            member)
+        cursor.executemany(
+            "INSERT OR IGNORE INTO book VALUES (?, ?, ?, ?)", book)
+        cursor.executemany(
+            """
+            INSERT OR IGNORE INTO
+            sale (sdate, mid, bid, sqty, sdiscount, stotal)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            sale
+        )
 
 
 def add_sale(
@@ -93,269 +197,248 @@ def add_sale(
     """新增銷售記錄，驗證會員、書籍編號和庫存，計算總額並更新庫存。"""
     cursor = conn.cursor()
     try:
-        # 驗證會員是否存在
-        cursor.execute("SELECT mid FROM member WHERE mid = ?", (mid,))
-        member = cursor.fetchone()
-        if not member:
+        # 驗證會員、書籍是否存在且庫存足夠
+        cursor.execute(_SQL_VALIDATE_SALE, (mid, bid))
+        row = cursor.fetchone()
+        if row['m_ok'] is None:
             return False, f"錯誤：會員編號 {mid} 無效。"
-
-        # 驗證書籍是否存在且庫存足夠
-        cursor.execute("SELECT bprice, bstock FROM book WHERE bid = ?", (bid,))
-        book = cursor.fetchone()
-        if not book:
+        if row['bprice'] is None:
             return False, f"錯誤：書籍編號 {bid} 無效。"
-        if book['bstock'] < sqty:
-            return False, f"錯誤：書籍庫存不足 (現有庫存: {book['bstock']})。"
+        if row['bstock'] < sqty:
+            return False, f"錯誤：書籍庫存不足 (現有庫存: {row['bstock']})。"
 
         # 計算總金額
-        stotal: int = (book['bprice'] * sqty) - sdiscount
-
-        # 新增銷售記錄
-        insert: str = """
-        INSERT INTO sale (sdate, mid, bid, sqty, sdiscount, stotal)
-        VALUES (?, ?, ?, ?, ?, ?)
-        """
-        cursor.execute(insert, (sdate, mid, bid, sqty, sdiscount, stotal))
-
-        # 更新書籍庫存
-        sql_update_book: str = """
-        UPDATE book SET bstock = bstock - ? WHERE bid = ?
-        """
-        cursor.execute(sql_update_book, (sqty, bid))
-
-        # 提交交易
-        conn.commit()
+        stotal: int = (row['bprice'] * sqty) - sdiscount
+
+        # 新增銷售記錄並更新書籍庫存，於同一筆交易中提交，失敗時自動回滾
+        with conn:
+            cursor.execute(_SQL_INSERT_SALE,
+                           (sdate, mid, bid, sqty, sdiscount, stotal))
+            cursor.execute(_SQL_UPDATE_STOCK, (sqty, bid))
         return True, f"銷售記錄已新增！(銷售總額: {stotal:,})"
 
     except sqlite3.Error as e:
-        # 回滾交易
-        conn.rollback()
         return False, f"交易失敗：{e}"
 
 
 def print_sale_report(conn: sqlite3.Connection) -> None:
     """查詢並顯示所有銷售報表，按銷售編號排序。"""
     cursor = conn.cursor()
-    cursor.execute("""
-        SELECT
-            s.sid,
-            s.sdate,
-            m.mname,
-            b.btitle,
-            b.bprice,
-            s.sqty,
-            s.sdiscount,
-            s.stotal
-        FROM sale s
-        JOIN member m ON s.mid = m.mid
-        JOIN book b ON s.bid = b.bid
-        ORDER BY s.sid
-    """)
-    sales = cursor.fetchall()
-
-    if not sales:
-        print(f"\n目前沒有銷售記錄。")
+    # 報表資料量隨銷售筆數成長，改用 tuple 列並依欄位位置取值
+    cursor.row_factory = None
+    cursor.execute(_SQL_REPORT)
+    # 逐筆讀取結果，不一次載入全部銷售記錄；先取第一筆判斷是否有資料
+    first = cursor.fetchone()
+
+    if first is None:
+        print("\n目前沒有銷售記錄。")
         return
 
-    print("f\n==================== 銷售報表 ====================")
-    for sale in sales:
-        print(f"銷售 #{sale['sid']}")
-        print(f"銷售編號: {sale['sid']}")
-        print(f"銷售日期: {sale['sdate']}")
-        print(f"會員姓名: {sale['mname']}")
-        print(f"書籍標題: {sale['btitle']}")
-        print("-" * 50)
-        print(f"{'單價':<8}\t{'數量':<4}\t{'折扣':<6}\t{'小計'}")
-        print("-" * 50)
-        print(f"{sale['bprice']:<8}\t{sale['sqty']:<4}\t"
-              f"{sale['sdiscount']:<6}\t{sale['stotal']:,}")
-        print("-" * 50)
-        print(f"銷售總額: {sale['stotal']:,}")
-        print("=" * 50)
-        print()
+    # 每筆銷售組合成一段字串後寫出，交由 stdout 緩衝合併
+    write = sys.stdout.write
+    write("\n==================== 銷售報表 ====================\n")
+    for sale in chain((first,), cursor):
+        sid, sdate, mname, btitle, bprice, sqty, sdiscount, stotal = sale
+        write(
+            f"銷售 #{sid}\n"
+            f"銷售編號: {sid}\n"
+            f"銷售日期: {sdate}\n"
+            f"會員姓名: {mname}\n"
+            f"書籍標題: {btitle}\n"
+            f"{_SEP50}\n"
+            f"{_REPORT_HEADER}\n"
+            f"{_SEP50}\n"
+            f"{bprice:<8}\t{sqty:<4}\t"
+            f"{sdiscount:<6}\t{stotal:,}\n"
+            f"{_SEP50}\n"
+            f"銷售總額: {stotal:,}\n"
+            f"{_EQ50}\n"
+            "\n"
+        )
 
 
 def update_sale(conn: sqlite3.Connection) -> None:
     """顯示銷售記錄列表，提示使用者輸入要更新的銷售編號和新的折扣金額，重新計算總額。"""
     cursor = conn.cursor()
-    cursor.execute("""
-        SELECT s.sid, m.mname, s.sdate
-        FROM sale s
-        JOIN member m ON s.mid = m.mid
-        ORDER BY s.sid
-    """)
+    cursor.row_factory = None
+    cursor.execute(_SQL_UPDATE_LIST)
     sales_list = cursor.fetchall()
+    # 以銷售編號建立對照表，後續驗證與計算不必再查詢資料庫
+    details_map = {
+        sid: (bprice, sqty) for sid, _, _, bprice, sqty in sales_list
+    }
 
     if not sales_list:
-        print(f"\n目前沒有銷售記錄可以更新。")
+        print("\n目前沒有銷售記錄可以更新。")
         return
 
-    print(f"\n======== 銷售記錄列表 ========")
-    for sale in sales_list:
-        print(f"{sale['sid']}. 銷售編號: {sale['sid']} - 會員: {sale['mname']} - "
-              f"日期: {sale['sdate']}")
-    print(f"===============================")
+    print("\n======== 銷售記錄列表 ========")
+    for sid, mname, sdate, _, _ in sales_list:
+        print(f"{sid}. 銷售編號: {sid} - 會員: {mname} - 日期: {sdate}")
+    print("===============================")
 
     while True:
         saleid: str = input("請選擇要更新的銷售編號 (輸入數字或按 Enter 取消): ")
         if not saleid:
-            print(f"取消更新。")
+            print("取消更新。")
             return
-        if saleid.isdigit():
+        try:
             sale_id: int = int(saleid)
-            cursor.execute("SELECT sid FROM sale WHERE sid = ?", (sale_id,))
-            existing_sale = cursor.fetchone()
-            if existing_sale:
-                break
-            else:
-                print(f"輸入的銷售編號不存在，請重新輸入。")
+        except ValueError:
+            print("輸入無效，請輸入數字或按 Enter 取消。")
+            continue
+        # int() 接受帶正負號的輸入，負數一併視為無效
+        if sale_id < 0:
+            print("輸入無效，請輸入數字或按 Enter 取消。")
+            continue
+        details = details_map.get(sale_id)
+        if details is not None:
+            break
         else:
-            print(f"輸入無效，請輸入數字或按 Enter 取消。")
+            print("輸入的銷售編號不存在，請重新輸入。")
 
     while True:
         ndiscount: str = input("請輸入新的折扣金額：")
-        if ndiscount.isdigit():
+        try:
             newdiscount: int = int(ndiscount)
-            if newdiscount >= 0:
-                break
-            else:
-                print(f"折扣金額不能為負數，請重新輸入。")
+        except ValueError:
+            print("輸入無效，請輸入數字。")
+            continue
+        if newdiscount >= 0:
+            break
         else:
-            print(f"輸入無效，請輸入數字。")
-
-    # 查詢相關的書籍單價和數量以重新計算總額
-    cursor.execute("""
-        SELECT b.bprice, s.sqty
-        FROM sale s
-        JOIN book b ON s.bid = b.bid
-        WHERE s.sid = ?
-    """, (sale_id,))
-    details = cursor.fetchone()
-
-    if details:
-        nstotal: int = (details['bprice'] * details['sqty']) - newdiscount
-        cursor.execute(
-            """
-            UPDATE sale SET sdiscount = ?, stotal = ? WHERE sid = ?
-            """,
-            (newdiscount, nstotal, sale_id)
-        )
-        conn.commit()
-        print(f"=> 銷售編號 {sale_id} 已更新！(銷售總額: {nstotal:,})")
-    else:
-        print(f"更新銷售記錄時發生錯誤，找不到相關銷售資訊。")
+            print("折扣金額不能為負數，請重新輸入。")
+
+    # 以列表中的書籍單價和數量重新計算總額
+    bprice, sqty = details
+    nstotal: int = (bprice * sqty) - newdiscount
+    cursor.execute(_SQL_UPDATE_SALE, (newdiscount, nstotal, sale_id))
+    conn.commit()
+    # 列表取得後該筆記錄可能已被其他連線刪除
+    if cursor.rowcount == 0:
+        print("更新銷售記錄時發生錯誤，找不到相關銷售資訊。")
+        return
+    print(f"=> 銷售編號 {sale_id} 已更新！(銷售總額: {nstotal:,})")
 
 
 def delete_sale(conn: sqlite3.Connection) -> None:
     """顯示銷售記錄列表，提示使用者輸入要刪除的銷售編號，執行刪除操作並提交"""
     cursor = conn.cursor()
-    cursor.execute(
-        """
-        SELECT s.sid, m.mname, s.sdate, b.btitle
-        FROM sale s
-        JOIN member m ON s.mid = m.mid
-        JOIN book b ON s.bid = b.bid
-        ORDER BY s.sid
-        """
-    )
+    cursor.row_factory = None
+    cursor.execute(_SQL_DELETE_LIST)
     sales_list = cursor.fetchall()
+    sale_ids = {sale[0] for sale in sales_list}
 
     if not sales_list:
-        print(f"\n目前沒有銷售記錄可以刪除。")
+        print("\n目前沒有銷售記錄可以刪除。")
         return
 
-    print(f"\n======== 銷售記錄列表 ========")
-    for sale in sales_list:
-        print(f"{sale['sid']}. 銷售編號: {sale['sid']} - 會員: {sale['mname']} - "
-              f"書籍: {sale['btitle']} - 日期: {sale['sdate']}")
-    print(f"===============================")
+    print("\n======== 銷售記錄列表 ========")
+    for sid, mname, sdate, btitle in sales_list:
+        print(f"{sid}. 銷售編號: {sid} - 會員: {mname} - "
+              f"書籍: {btitle} - 日期: {sdate}")
+    print("===============================")
 
     while True:
-        sale_id_str: str = input(f"請選擇要刪除的銷售編號 (輸入數字或按 Enter 取消): ")
+        sale_id_str: str = input("請選擇要刪除的銷售編號 (輸入數字或按 Enter 取消): ")
         if not sale_id_str:
-            print(f"取消刪除。")
+            print("取消刪除。")
             return
-        if sale_id_str.isdigit():
+        try:
             sale_id_to_delete: int = int(sale_id_str)
-            cursor.execute("SELECT sid FROM sale WHERE sid = ?",
-                           (sale_id_to_delete,))
-            existing_sale = cursor.fetchone()
-            if existing_sale:
-                break
-            else:
-                print(f"輸入的銷售編號不存在，請重新輸入。")
+        except ValueError:
+            print("=> 錯誤：請輸入有效的數字")
+            continue
+        # int() 接受帶正負號的輸入，負數一併視為無效
+        if sale_id_to_delete < 0:
+            print("=> 錯誤：請輸入有效的數字")
+            continue
+        if sale_id_to_delete in sale_ids:
+            break
         else:
-            print(f"=> 錯誤：請輸入有效的數字")
+            print("輸入的銷售編號不存在，請重新輸入。")
 
-    cursor.execute("DELETE FROM sale WHERE sid = ?", (sale_id_to_delete,))
+    cursor.execute(_SQL_DELETE_SALE, (sale_id_to_delete,))
     conn.commit()
+    # 列表取得後該筆記錄可能已被其他連線刪除
+    if cursor.rowcount == 0:
+        print("刪除銷售記錄時發生錯誤，找不到相關銷售資訊。")
+        return
     print(f"=> 銷售編號 {sale_id_to_delete} 已刪除")
 
 
+def _add_sale_interactive(conn: sqlite3.Connection) -> None:
+    """提示使用者輸入銷售資料並新增銷售記錄"""
+    sdate = input("請輸入銷售日期 (YYYY-MM-DD): ")
+    if not checkdate(sdate):
+        print("=> 錯誤：日期格式無效，請使用 YYYY-MM-DD 格式。")
+        return
+
+    mid = input("請輸入會員編號：")
+    bid = input("請輸入書籍編號：")
+
+    # try 只包住整數轉換，避免其他錯誤被誤判為輸入格式錯誤
+    sqty_str = input("請輸入購買數量：")
+    try:
+        sqty = int(sqty_str)
+    except ValueError:
+        print("=> 錯誤：數量或折扣必須為整數，請重新輸入")
+        return
+    if sqty <= 0:
+        print("=> 錯誤：數量必須為正整數，請重新輸入")
+        return
+
+    sdiscount_str = input("請輸入折扣金額：")
+    try:
+        sdiscount = int(sdiscount_str)
+    except ValueError:
+        print("=> 錯誤：數量或折扣必須為整數，請重新輸入")
+        return
+    if sdiscount < 0:
+        print("=> 錯誤：折扣金額不能為負數，請重新輸入")
+        return
+
+    success, message = add_sale(conn, sdate, mid, bid, sqty, sdiscount)
+    print(f"=> {message}")
+
+
 def main() -> None:
     """程式主流程，包含選單迴圈和各功能的呼叫"""
     with connect_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute(f"SELECT COUNT(*) FROM member")
-        member_count = cursor.fetchone()[0]
-        if member_count == 0:
-            print(f"資料庫為空或首次運行，正在初始化預設資料...")
+        # 以 user_version 記錄是否已寫入預設資料，避免每次啟動掃描資料表
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        # 舊版程式建立的資料庫尚未設定版本，需確認是否已有資料；
+        # 這類資料庫缺少的索引已由 connect_db 補建
+        seed = version < _SEEDED_VERSION and conn.execute(
+            "SELECT COUNT(*) FROM member").fetchone()[0] == 0
+        if seed:
+            print("資料庫為空或首次運行，正在初始化預設資料...")
             initialize_db(conn)
         else:
-            print(f"檢測到現有資料，跳過預設資料初始化。")
+            print("檢測到現有資料，跳過預設資料初始化。")
+        if version < _SEEDED_VERSION:
+            conn.execute(f"PRAGMA user_version = {_SEEDED_VERSION}")
+
+        # 選單選項與對應的處理函式
+        handlers = {
+            '1': _add_sale_interactive,
+            '2': print_sale_report,
+            '3': update_sale,
+            '4': delete_sale,
+        }
 
         while True:
-            print(f"\n***************選單***************")
-            print(f"1. 新增銷售記錄")
-            print(f"2. 顯示銷售報表")
-            print(f"3. 更新銷售記錄")
-            print(f"4. 刪除銷售記錄")
-            print(f"5. 離開")
-            print(f"**********************************")
-            choice = input(f"請選擇功能: ")
-            if choice == '1':
-                sdate = input(f"請輸入銷售日期 (YYYY-MM-DD): ")
-                if not checkdate(sdate):
-                    print(f"=> 錯誤：日期格式無效，請使用 YYYY-MM-DD 格式。")
-                    continue
-
-                mid = input(f"請輸入會員編號：")
-                bid = input(f"請輸入書籍編號：")
-
-                try:
-                    sqty_str = input(f"請輸入購買數量：")
-                    sqty = int(sqty_str)
-                    if sqty <= 0:
-                        print(f"=> 錯誤：數量必須為正整數，請重新輸入")
-                        continue
-
-                    sdiscount_str = input(f"請輸入折扣金額：")
-                    sdiscount = int(sdiscount_str)
-                    if sdiscount < 0:
-                        print(f"=> 錯誤：折扣金額不能為負數，請重新輸入")
-                        continue
-
-                    success, message = add_sale(
-                        conn, sdate,
-                        mid, bid, sqty, sdiscount
-                    )
-                    print(f"=> {message}")
-
-                except ValueError:
-                    print(f"=> 錯誤：數量或折扣必須為整數，請重新輸入")
-
-            elif choice == '2':
-                print_sale_report(conn)
-            elif choice == '3':
-                update_sale(conn)
-            elif choice == '4':
-                delete_sale(conn)
+            sys.stdout.write(_MENU)
+            choice = input("請選擇功能: ")
+            handler = handlers.get(choice)
+            if handler is not None:
+                handler(conn)
             elif choice == '5' or choice.lower() == 'enter':
                 break
             else:
-                print(f"=> 請輸入有效的選項（1-5）")
+                print("=> 請輸入有效的選項（1-5）")
 
-    print(f"感謝使用書店管理系統！")
+    print("感謝使用書店管理系統！")
 
 
 if __name__ == "__main__":